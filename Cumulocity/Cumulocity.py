@@ -2,14 +2,21 @@
 """Cumulocity IoT Robot Framework library
 """
 
+import copy
+import functools
 import logging
-from typing import List, Union, Dict, Any, Optional, Tuple
+import os
+from typing import List, Union, Dict, Any, Optional, Tuple, Callable, Sequence
 import json
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from dotmap import DotMap
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from c8y_test_core.assert_operation import AssertOperation
 from c8y_test_core.c8y import CustomCumulocityApp
 from c8y_test_core.assert_device_registration import (
@@ -28,11 +35,59 @@ from c8y_api.model import ManagedObject
 from robot.api.deco import keyword, library
 from robot.utils.asserts import fail
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(module)s -%(levelname)s- %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Logging is configured by Robot Framework, however console logging can be
+# enabled when debugging the library, e.g. C8Y_LOG_LEVEL=DEBUG
+_LOG_LEVEL = os.getenv("C8Y_LOG_LEVEL", "").strip().upper()
+if _LOG_LEVEL:
+    _level = (
+        int(_LOG_LEVEL) if _LOG_LEVEL.isdigit() else logging.getLevelName(_LOG_LEVEL)
+    )
+    if isinstance(_level, int):
+        logging.basicConfig(
+            level=_level,
+            format="%(asctime)s %(module)s -%(levelname)s- %(message)s",
+        )
+    else:
+        logger.warning(
+            "Invalid C8Y_LOG_LEVEL value. Console logging will not be enabled. value=%s",
+            _LOG_LEVEL,
+        )
+
+# Use the faster orjson parser if it is installed (e.g. via the "orjson" extra)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses integers which do not fit in 64 bits as floats. Any integer with
+# less than 19 digits fits, so longer digit sequences are parsed by the json module
+LONG_INTEGER_PATTERN = re.compile(r"\d{19,}")
+
+
+def json_loads(value: Union[str, bytes, bytearray]) -> Any:
+    """Parse json, using orjson if it is installed.
+
+    Documents which orjson would parse differently to the json module (e.g.
+    integers larger than 64 bits, NaN or Infinity) are parsed by the json module,
+    so the result does not depend on whether orjson is installed.
+    """
+    if orjson is None:
+        return json.loads(value)
+
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf8")
+
+    if LONG_INTEGER_PATTERN.search(value):
+        return json.loads(value)
+
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
+
 try:
     from . import _version
 
@@ -42,6 +97,9 @@ except Exception:
 
 __author__ = "Reuben Miller"
 
+# Only search for and load the .env file once per process
+_DOTENV_LOADED = False
+
 
 def deprecated(name: str, alternatives: List[str]):
     """Print a deprecation warning
@@ -62,24 +120,122 @@ def deprecated(name: str, alternatives: List[str]):
         )
 
 
+DOT_NOTATION_PATTERN = re.compile(r"^[\w.\-: ]+$")
+
+
 def is_dot_notation(key: str) -> bool:
-    return re.match(r"^[\w.\-: ]+$", key, re.IGNORECASE) is not None
+    return DOT_NOTATION_PATTERN.match(key) is not None
 
 
 def try_parse_json(value: Any, default=str) -> Any:
     """Try parsing an input value that might be json, and
-    fallback to a given type on errors
+    fallback to a given type on errors. Values which are not
+    strings (e.g. an already parsed dictionary) are returned as is.
     """
+    if not isinstance(value, (str, bytes, bytearray)):
+        return value
+
     try:
-        return json.loads(value)
+        return json_loads(value)
     except ValueError:
         return default(value)
 
 
-ASSERTION_MAPPING = {
-    "assert_count": "Device Should Have %s/s",
-    "assert_exists": "%s Should Exist",
-}
+@functools.lru_cache(maxsize=64)
+def _load_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "r", encoding="utf8") as file:
+        return json_loads(file.read())
+
+
+def load_json_file(path: str) -> Any:
+    """Load a json file. The parsed contents are cached by the absolute path,
+    modification time and size of the file, so changes to the file are picked
+    up on the next call. A copy is returned, so it is safe to modify.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return copy.deepcopy(_load_json_file(path, stat.st_mtime_ns, stat.st_size))
+
+
+class CappedRetry(Retry):
+    """Retry policy which limits the total time spent sleeping between the retries
+    of a request (including waiting for Retry-After headers), so that large values
+    sent by the server do not exceed the keyword timeouts.
+    """
+
+    # Remaining time which can be spent sleeping. It is passed on to the new Retry
+    # object which urllib3 creates for each retry of a request
+    sleep_budget: Optional[float] = None
+
+    def new(self, **kwargs) -> "CappedRetry":
+        retry = super().new(**kwargs)
+        retry.sleep_budget = self.sleep_budget
+        return retry
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None or self.sleep_budget is None:
+            return retry_after
+        return min(retry_after, self.sleep_budget)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if self.sleep_budget is None:
+            return backoff
+        return min(backoff, self.sleep_budget)
+
+    def sleep(self, response: Any = None):
+        if self.sleep_budget is None:
+            super().sleep(response)
+            return
+
+        started = time.monotonic()
+        super().sleep(response)
+        self.sleep_budget = max(self.sleep_budget - (time.monotonic() - started), 0)
+
+
+# Device information banners which are logged as a single message
+EXTERNAL_IDENTITY_INFO_FORMAT = "\n".join(
+    [
+        "-" * 60,
+        "EXTERNAL SERIAL  : %s",
+        "EXTERNAL ID      : %s",
+        "EXTERNAL URL     : %s",
+        "-" * 60,
+    ]
+)
+
+DEVICE_INFO_FORMAT = "\n".join(
+    [
+        "-" * 60,
+        "DEVICE SERIAL  : %s",
+        "DEVICE ID      : %s",
+        "DEVICE TYPE    : %s",
+        "DEVICE URL     : %s",
+        "-" * 60,
+    ]
+)
+
+# Characters which a json document (without leading whitespace) can start with
+JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+JSON_LITERALS = {"true": True, "false": False, "null": None}
+
+
+def parse_typed_value(value: str) -> Any:
+    """Parse a value to its json type (e.g. number, boolean or object), and
+    fallback to the string itself if it is not valid json.
+
+    Plain strings (the most common case) are detected without running the json
+    parser, so they don't pay for a failed parse.
+    """
+    if value in JSON_LITERALS:
+        return JSON_LITERALS[value]
+
+    if value[:1] not in JSON_START_CHARS:
+        return value
+
+    return try_parse_json(value, str)
 
 
 @library(scope="GLOBAL", auto_keywords=False)
@@ -112,22 +268,39 @@ class Cumulocity:
     # Default HTTP request timeout
     DEFAULT_REQUEST_TIMEOUT = 30.0
 
+    # Maximum number of concurrent requests used by keywords accepting multiple items
+    DEFAULT_MAX_WORKERS = 8
+
+    # Maximum number of keep-alive connections kept open to Cumulocity
+    DEFAULT_POOL_MAXSIZE = 32
+
     # Class-internal parameters
     device_mgmt: DeviceManagement
     c8y: CustomCumulocityApp
 
+    # Cumulocity clients shared by all library instances in the process,
+    # keyed by (base url, tenant, user, request timeout)
+    _shared_clients: Dict[Tuple[str, str, str, float], CustomCumulocityApp] = {}
+    _shared_clients_lock = threading.Lock()
+
     # Constructor
     def __init__(
         self,
         timeout: int = DEFAULT_TIMEOUT,
         request_timeout=DEFAULT_REQUEST_TIMEOUT,
     ):
-        self.devices = {}
+        # Managed objects resolved via "Set Managed Object", keyed by (external_type, external_id)
+        self.devices: Dict[Tuple[str, str], str] = {}
         self._on_cleanup = []
-        load_dotenv()
+        self._device_url_template: Optional[str] = None
+
+        global _DOTENV_LOADED  # pylint: disable=global-statement
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
 
         try:
-            self.c8y = CustomCumulocityApp(timeout=request_timeout)
+            self.c8y = self._get_client(request_timeout)
         except Exception as ex:
             logger.warning(
                 "Could not load Cumulocity API client. Trying to continue. %s",
@@ -141,6 +314,97 @@ class Cumulocity:
         # pylint: disable=invalid-name
         self.ROBOT_LIBRARY_LISTENER = self
 
+    def _get_client(self, request_timeout: float) -> CustomCumulocityApp:
+        """Get a Cumulocity client for the current environment settings.
+
+        Clients are shared between library instances (e.g. when the library is imported
+        by multiple suites) so that the authentication and connection setup is only
+        done once per tenant.
+
+        Args:
+            request_timeout (float): HTTP request timeout in seconds
+
+        Returns:
+            CustomCumulocityApp: Cumulocity client
+        """
+        key = (
+            os.getenv("C8Y_BASEURL", ""),
+            os.getenv("C8Y_TENANT", ""),
+            os.getenv("C8Y_USER", ""),
+            request_timeout,
+        )
+        with self._shared_clients_lock:
+            client = self._shared_clients.get(key)
+            if client is None:
+                client = CustomCumulocityApp(timeout=request_timeout)
+                self._configure_session(client, request_timeout)
+                self._shared_clients[key] = client
+        return client
+
+    def _configure_session(self, c8y: CustomCumulocityApp, request_timeout: float):
+        """Configure the HTTP adapters of the client's session so that all keywords
+        reuse the same keep-alive connections, and transient gateway errors and
+        rate limiting (429) on idempotent requests are retried, honouring any
+        Retry-After header sent by the server. The total time spent waiting between
+        the retries of a request is limited to the request timeout.
+
+        The pool size can be changed via the C8Y_POOL_MAXSIZE environment variable.
+
+        Args:
+            c8y (CustomCumulocityApp): Cumulocity client
+            request_timeout (float): HTTP request timeout in seconds
+        """
+        pool_maxsize = self.DEFAULT_POOL_MAXSIZE
+        env_pool_maxsize = os.getenv("C8Y_POOL_MAXSIZE")
+        if env_pool_maxsize:
+            try:
+                pool_maxsize = int(env_pool_maxsize)
+            except ValueError:
+                pool_maxsize = 0
+
+            if pool_maxsize < 1:
+                logger.warning(
+                    "Invalid C8Y_POOL_MAXSIZE value. Using the default value instead. value=%s, default=%s",
+                    env_pool_maxsize,
+                    self.DEFAULT_POOL_MAXSIZE,
+                )
+                pool_maxsize = self.DEFAULT_POOL_MAXSIZE
+
+        # Read timeouts are not retried, as the server might have already
+        # processed the request, and the assertion keywords already poll
+        retry = CappedRetry(
+            total=3,
+            connect=1,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        retry.sleep_budget = request_timeout
+
+        # Reconfigure the mounted adapters rather than replacing them, as the client
+        # might use a custom adapter (e.g. to apply the request timeout)
+        adapters = {
+            c8y.session.get_adapter("https://"),
+            c8y.session.get_adapter("http://"),
+        }
+        for adapter in adapters:
+            if not isinstance(adapter, HTTPAdapter):
+                logger.debug(
+                    "Skipping configuration of unsupported HTTP adapter. type=%s",
+                    type(adapter).__name__,
+                )
+                continue
+
+            adapter.max_retries = retry
+            adapter.poolmanager.clear()
+            adapter.init_poolmanager(
+                pool_maxsize,
+                pool_maxsize,
+                block=getattr(adapter, "_pool_block", False),
+            )
+
     #
     # Hooks
     #
@@ -152,15 +416,26 @@ class Cumulocity:
             _data (Any): Test data
             result (Any): Test details
         """
-        for func in self._on_cleanup:
-            if callable(func):
-                try:
-                    func()
-                except Exception as ex:
-                    logger.warning("Cleanup function failed. error=%s", ex)
-
+        # Cleanup functions are run concurrently, so the order in which they run is
+        # undefined. Cumulocity does not prevent deleting objects which are still
+        # referenced by other objects (e.g. binaries or child devices), so the
+        # order does not affect the result
+        cleanup_funcs = list(self._on_cleanup)
         self._on_cleanup.clear()
 
+        def run_cleanup(func: Callable[[], Any]) -> Optional[Exception]:
+            try:
+                func()
+            except Exception as ex:
+                return ex
+            return None
+
+        # Log from the calling thread, as Robot Framework ignores
+        # messages logged from other threads
+        for ex in self._run_concurrently(run_cleanup, cleanup_funcs):
+            if ex is not None:
+                logger.warning("Cleanup function failed. error=%s", ex)
+
     #
     #
     #
@@ -640,7 +915,11 @@ class Cumulocity:
         """
         software_items = []
         for item in items:
-            raw_item = try_parse_json(item, str)
+            raw_item = item
+            # Only json documents need parsing, csv items are used as is
+            if isinstance(item, str) and item.lstrip()[:1] in ("{", "["):
+                raw_item = try_parse_json(item, str)
+
             if isinstance(raw_item, str):
                 software_item = Software(*raw_item.split(",", 5))
             elif isinstance(raw_item, dict):
@@ -650,8 +929,7 @@ class Cumulocity:
                     "Invalid software item definition. Only csv string or json dictionary are accepted"
                 )
 
-            if not software_item.action and default_action:
-                software_item.action = default_action
+            software_item.action = software_item.action or default_action
             software_items.append(software_item)
         return software_items
 
@@ -993,11 +1271,13 @@ class Cumulocity:
         """
         fragments_dict = {}
         if isinstance(fragments, str):
-            fragments_dict = json.loads(fragments)
+            fragments_dict = json_loads(fragments)
         elif isinstance(fragments, dict):
             fragments_dict = fragments
 
-        op_fragments = {"description": description, **fragments_dict, **kwargs}
+        op_fragments = {"description": description}
+        op_fragments.update(fragments_dict)
+        op_fragments.update(kwargs)
         operation = self.device_mgmt.create_operation(
             **op_fragments,
         )
@@ -1030,6 +1310,34 @@ class Cumulocity:
         operation = self._to_assert_operation(operation)
         return self._to_json(operation.assert_success(**kwargs))
 
+    @keyword("Operations Should Be SUCCESSFUL")
+    def operations_assert_success(
+        self, *operations: Union[str, AssertOperation], **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Assert that multiple operations are set to SUCCESSFUL
+
+        The operations are waited on concurrently, so the total wait time is
+        determined by the slowest operation rather than the sum of all of them.
+
+        Examples:
+
+        | ${op1}= | Install Software | package-001 |
+        | ${op2}= | Execute Shell Command | ls -l |
+        | Operations Should Be SUCCESSFUL | ${op1} | ${op2} | timeout=120 |
+
+        Args:
+            *operations (str|AssertOperation): Operations or operation ids
+
+        Returns:
+            List[Dict[str, Any]]: Operations (in the same order as given)
+        """
+        return self._run_concurrently(
+            lambda operation: self._to_json(
+                self._to_assert_operation(operation).assert_success(**kwargs)
+            ),
+            operations,
+        )
+
     @keyword("Operation Should Be PENDING")
     def operation_assert_pending(
         self, operation: Union[str, AssertOperation], **kwargs
@@ -1194,20 +1502,39 @@ class Cumulocity:
         if not item:
             return {}
 
-        data = item
-        if item and hasattr(item, "to_json"):
-            data = item.to_json()
-            if data and hasattr(item, "id"):
-                data["id"] = item.id
+        to_json = getattr(item, "to_json", None)
+        if to_json is None:
+            return item
+
+        data = to_json()
+        if data and hasattr(item, "id"):
+            data["id"] = item.id
 
         return data
 
     def _sequence_to_json(self, item: Union[List, Tuple]) -> List[Dict[str, Any]]:
         if isinstance(item, (list, tuple)):
-            return [self._to_json(subitem) for subitem in item]
+            to_json = self._to_json
+            return [to_json(subitem) for subitem in item]
 
         return self._to_json(item)
 
+    def _run_concurrently(
+        self, func: Callable[[Any], Any], items: Sequence[Any]
+    ) -> List[Any]:
+        """Call a function for each item using a bounded thread pool so that
+        independent requests do not have to wait for each other.
+
+        The results are returned in the same order as the items, and the first
+        exception (in item order) is re-raised.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        max_workers = min(len(items), self.DEFAULT_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(func, items))
+
     #
     # Library settings
     #
@@ -1223,14 +1550,41 @@ class Cumulocity:
         """
         self.device_mgmt.configure_retries(timeout=timeout)
 
+    @keyword("Clear Device Cache")
+    def clear_device_cache(self):
+        """Clear the cached external identity lookups used by "Set Managed Object"
+
+        Use this if an external identity was assigned to a different managed object
+        outside of this library, whilst the previous managed object still exists.
+        """
+        self.devices.clear()
+
     #
     # Devices / Child devices
     #
+    def _cache_managed_object(
+        self, external_id: str, external_type: str, managed_object: Any
+    ) -> Dict[str, Any]:
+        self.devices[(external_type, external_id)] = managed_object.id
+        return self._to_json(managed_object)
+
+    def _invalidate_managed_object(self, mo_id: str):
+        self.devices = {
+            key: value for key, value in self.devices.items() if value != mo_id
+        }
+
     def _set_managed_object_context(
         self, external_id: str, external_type: str = "c8y_Serial", **kwargs
     ):
         """Set the managed object context which will be used for subsequent keywords
 
+        The managed object id of each external identity is cached, so switching back
+        to a previously used external identity does not require another identity
+        lookup. The managed object is still fetched, so the returned json is
+        always up to date, and if it no longer exists then the external identity
+        is looked up again. The cache is only used when no additional keyword
+        arguments (e.g. timeout) are given.
+
         Args:
             external_id (str, optional): External identity. Defaults to None.
             external_type (str, optional): External identity type. Defaults to "c8y_Serial".
@@ -1238,14 +1592,23 @@ class Cumulocity:
         Returns:
             str: Managed object json
         """
+        cached_id = None if kwargs else self.devices.get((external_type, external_id))
+        if cached_id:
+            try:
+                managed_object = self.device_mgmt.c8y.inventory.get(cached_id)
+            except KeyError:
+                # Managed object was deleted outside of this library
+                self._invalidate_managed_object(cached_id)
+            else:
+                self.device_mgmt.set_device_id(managed_object.id)
+                return self._to_json(managed_object)
+
         managed_object = self.device_mgmt.identity.assert_exists(
             external_id, external_type, **kwargs
         )
         assert managed_object.id
         self.device_mgmt.set_device_id(managed_object.id)
-        return self._to_json(
-            managed_object,
-        )
+        return self._cache_managed_object(external_id, external_type, managed_object)
 
     @keyword("Set Device")
     def set_device(
@@ -1349,6 +1712,7 @@ class Cumulocity:
         self.device_mgmt.inventory.delete_device_and_user(
             external_id, external_id_type, **kwargs
         )
+        self.devices.pop((external_id_type, external_id), None)
 
     @keyword("Delete Managed Object")
     def delete_managed_object(self, mo_id: str, **kwargs):
@@ -1358,6 +1722,7 @@ class Cumulocity:
             mo_id (str): Managed object id
         """
         self.device_mgmt.c8y.inventory.delete(mo_id)
+        self._invalidate_managed_object(mo_id)
 
     @keyword("Create Managed Object")
     def create_managed_object(
@@ -1384,7 +1749,7 @@ class Cumulocity:
         Example:
             | ${type}= | Create Managed Object | {"name": "SimType", "type": "c8y_ModbusDeviceType", "c8y_IsDeviceType": {}, "c8y_Registers": []} |
         """
-        body = json.loads(fragments) if isinstance(fragments, str) else dict(fragments or {})
+        body = json_loads(fragments) if isinstance(fragments, str) else dict(fragments or {})
         body.update(kwargs)
         mo = ManagedObject.from_json(body)
         mo.c8y = self.device_mgmt.c8y
@@ -1410,7 +1775,7 @@ class Cumulocity:
         Returns:
             Dict[str, Any]: Updated managed object json
         """
-        body = json.loads(fragments) if isinstance(fragments, str) else dict(fragments)
+        body = json_loads(fragments) if isinstance(fragments, str) else dict(fragments)
         body.update(kwargs)
         c8y = self.device_mgmt.c8y
         updated = c8y.put(
@@ -1551,63 +1916,47 @@ class Cumulocity:
         )
 
     def _create_dict(self, properties: Tuple[Union[str, Dict[str, Any]], ...]) -> dict:
-        values = DotMap()
-        value_dict = {}
+        values: Dict[str, Any] = {}
         for item in properties:
             if isinstance(item, str):
-                if item.startswith("{") and item.endswith("}"):
-                    obj = json.loads(item)
-
-                    value_dict = DotMap(
-                        {
-                            **value_dict,
-                            **obj,
-                        }
-                    )
+                if item[:1] == "{":
+                    values.update(json_loads(item))
                 else:
-                    key, _, value = str(item).partition("=")
+                    key, _, value = item.partition("=")
                     key = key.strip()
                     value = value.strip()
 
                     # Try to parse value to a type, fallback to a string
-                    try:
-                        typed_value = json.loads(value)
-                    except json.decoder.JSONDecodeError:
-                        typed_value = str(value)
+                    typed_value = parse_typed_value(value)
 
                     if key and is_dot_notation(key):
+                        if "." not in key:
+                            values[key] = typed_value
+                            continue
+
                         # Assign nested path
                         tmp = values
-                        key_parts = key.split(".")
-                        for k in key_parts[:-1]:
-                            tmp = tmp[k]
+                        *parent_keys, name = key.split(".")
+                        for k in parent_keys:
+                            tmp = tmp.setdefault(k, {})
 
-                        tmp[key_parts[-1]] = typed_value
+                        tmp[name] = typed_value
                     elif isinstance(typed_value, dict):
-                        values = DotMap(
-                            {
-                                **values,
-                                **typed_value,
-                            }
-                        )
+                        values.update(typed_value)
                     else:
                         raise ValueError(
                             "Value type not supported. Please set a string, number, boolean, or object"
                         )
 
             elif isinstance(item, dict):
-                value_dict = DotMap(
-                    {
-                        **value_dict,
-                        **item,
-                    }
-                )
+                # Copy so that nested assignments don't modify the caller's dictionary
+                values.update(copy.deepcopy(item))
             else:
                 raise ValueError(
                     "Value type not supported. Only str and dictionaries are supported as properties"
                 )
 
-        return values.toDict()
+        return values
 
     @keyword("Should Be A Child Device Of Device")
     def assert_child_device_relationship(
@@ -1637,6 +1986,15 @@ class Cumulocity:
         """
         return self.device_mgmt.restart(**kwargs)
 
+    def _device_url(self, device_id: str) -> str:
+        """Get the link to a device in the Device Management application"""
+        if self._device_url_template is None:
+            self._device_url_template = (
+                self.device_mgmt.c8y.base_url.rstrip("/")
+                + "/apps/devicemanagement/index.html#/device/{}/control"
+            )
+        return self._device_url_template.format(device_id)
+
     def _managed_object_exists(
         self,
         external_id: str,
@@ -1649,23 +2007,15 @@ class Cumulocity:
         )
         assert managed_object.id, "Managed object id is not set"
         self.device_mgmt.set_device_id(managed_object.id)
+        data = self._cache_managed_object(external_id, external_type, managed_object)
 
-        if show_info:
-            mgmt_url = "/".join(
-                [
-                    self.device_mgmt.c8y.base_url,
-                    "apps/devicemanagement/index.html#/device",
-                    managed_object.id,
-                    "control",
-                ]
+        if show_info and logger.isEnabledFor(logging.INFO):
+            mgmt_url = self._device_url(managed_object.id)
+            logger.info(
+                EXTERNAL_IDENTITY_INFO_FORMAT, external_id, managed_object.id, mgmt_url
             )
-            logger.info("-" * 60)
-            logger.info("EXTERNAL SERIAL  : %s", external_id)
-            logger.info("EXTERNAL ID      : %s", managed_object.id)
-            logger.info("EXTERNAL URL     : %s", mgmt_url)
-            logger.info("-" * 60)
 
-        return self._to_json(managed_object)
+        return data
 
     @keyword("Device Should Exist")
     def device_should_exist(
@@ -1711,6 +2061,43 @@ class Cumulocity:
             external_id, external_type, show_info, **kwargs
         )
 
+    @keyword("External Identities Should Exist")
+    def managed_objects_should_exist(
+        self,
+        *external_ids: str,
+        external_type: str = "c8y_Serial",
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Assert that multiple external identities exist. The identities are
+        checked concurrently, so the keyword takes roughly as long as the slowest lookup.
+
+        Unlike "External Identity Should Exist", the device context is not changed,
+        however the managed objects are cached so that a later "Set Managed Object"
+        does not need another lookup.
+
+        Examples:
+
+        | ${mos}= | External Identities Should Exist | device01 | device02 | device03 |
+        | ${mos}= | External Identities Should Exist | device01 | device02 | external_type=c8y_Custom |
+
+        Args:
+            *external_ids (str): External identities
+            external_type (str, optional): External identity type. Defaults to "c8y_Serial".
+
+        Returns:
+            List[Dict[str, Any]]: Managed objects (in the same order as the external identities)
+        """
+        return self._run_concurrently(
+            lambda external_id: self._cache_managed_object(
+                external_id,
+                external_type,
+                self.device_mgmt.identity.assert_exists(
+                    external_id, external_type, **kwargs
+                ),
+            ),
+            external_ids,
+        )
+
     @keyword("Log Device Info")
     def show_device_information(self, device_id: Optional[str] = None, **kwargs):
         """Show device information, e.g. id, external id and a link to the
@@ -1733,25 +2120,20 @@ class Cumulocity:
         managed_object = self.device_mgmt.inventory.assert_exists(device_id, **kwargs)
         assert managed_object.id, "Managed object id is not set"
 
-        external_id = str(managed_object.owner)
-        if external_id.startswith("device_"):
-            external_id = external_id[7:]
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
-        mgmt_url = "/".join(
-            [
-                self.device_mgmt.c8y.base_url,
-                "apps/devicemanagement/index.html#/device",
-                managed_object.id,
-                "control",
-            ]
-        )
+        external_id = (managed_object.owner or "").removeprefix("device_")
 
-        logger.info("-" * 60)
-        logger.info("DEVICE SERIAL  : %s", external_id)
-        logger.info("DEVICE ID      : %s", managed_object.id)
-        logger.info("DEVICE TYPE    : %s", managed_object.type)
-        logger.info("DEVICE URL     : %s", mgmt_url)
-        logger.info("-" * 60)
+        mgmt_url = self._device_url(managed_object.id)
+
+        logger.info(
+            DEVICE_INFO_FORMAT,
+            external_id,
+            managed_object.id,
+            managed_object.type,
+            mgmt_url,
+        )
 
     @keyword("Should Have Services")
     def assert_services(
@@ -1857,6 +2239,82 @@ class Cumulocity:
             **kwargs,
         )
 
+    @keyword("Register Devices Concurrently With Basic Auth")
+    def register_devices_concurrently_with_basic_auth(
+        self,
+        *external_ids: str,
+        external_type: str = "c8y_Serial",
+        device_type: str = "thin-edge.io",
+        **kwargs,
+    ) -> List[DeviceCredentials]:
+        """Register multiple devices that require non-cert based authentication
+        (e.g. basic auth). It is the same as calling "Bulk Register Device With Basic Auth"
+        for each device, however the devices are registered concurrently. It still
+        sends one bulk registration request per device, not a single request
+        containing all of the devices.
+
+        The name of each device defaults to its external id.
+
+        Arguments:
+            *external_ids (str): External ids
+            external_type (str): External type. Defaults to c8y_Serial
+            device_type (str): Type of the devices. Defaults to thin-edge.io
+
+        Examples:
+
+            | @{CREDENTIALS}= | Register Devices Concurrently With Basic Auth | MyCustomDevice0001 | MyCustomDevice0002 |
+            | @{CREDENTIALS}= | Register Devices Concurrently With Basic Auth | MyCustomDevice0001 | MyCustomDevice0002 | device_type=linuxA |
+
+        Returns:
+            List[DeviceCredentials]: Credentials (in the same order as the external ids)
+        """
+        return self._run_concurrently(
+            lambda external_id: self.device_mgmt.registration.bulk_register_with_basic_auth(
+                external_id=external_id,
+                external_type=external_type,
+                device_type=device_type,
+                **kwargs,
+            ),
+            external_ids,
+        )
+
+    @keyword("Register Devices Concurrently With Cumulocity CA")
+    def register_devices_concurrently_with_cumulocity_ca(
+        self,
+        *external_ids: str,
+        external_type: str = "c8y_Serial",
+        device_type: str = "thin-edge.io",
+        **kwargs,
+    ) -> List[DeviceSimpleEnrollCredentials]:
+        """Register multiple devices using Cumulocity CA. It is the same as calling
+        "Bulk Register Device With Cumulocity CA" for each device, however the devices
+        are registered concurrently. It still sends one bulk registration request
+        per device, not a single request containing all of the devices.
+
+        The name of each device defaults to its external id.
+
+        Arguments:
+            *external_ids (str): External ids
+            external_type (str): External type. Defaults to c8y_Serial
+            device_type (str): Type of the devices. Defaults to thin-edge.io
+
+        Examples:
+
+            | @{CREDENTIALS}= | Register Devices Concurrently With Cumulocity CA | MyCustomDevice0001 | MyCustomDevice0002 |
+
+        Returns:
+            List[DeviceSimpleEnrollCredentials]: Credentials (in the same order as the external ids)
+        """
+        return self._run_concurrently(
+            lambda external_id: self.device_mgmt.registration.bulk_register_with_ca(
+                external_id=external_id,
+                external_type=external_type,
+                device_type=device_type,
+                **kwargs,
+            ),
+            external_ids,
+        )
+
     @keyword("Register Device With Basic Auth")
     def register_device_with_basic_auth(
         self,
@@ -1902,7 +2360,7 @@ class Cumulocity:
         """
         profile_contents = {}
         if isinstance(profile, str):
-            profile_contents = json.loads(profile)
+            profile_contents = json_loads(profile)
         elif isinstance(profile, dict):
             profile_contents = profile
 
@@ -1993,8 +2451,7 @@ class Cumulocity:
         data = {}
         if file:
             # Load from json file
-            with open(file, "r", encoding="utf8") as f:
-                data = json.load(f)
+            data = load_json_file(file)
 
         mo = self.device_mgmt.smartrest2.create(name, data)
         self._on_cleanup.append(mo.delete)